@@ -1,61 +1,137 @@
+import math
 import re
+from array import array
+from bisect import bisect_left
+
+# Matches one term as (sign, digits, 'x', exponent), e.g. "+ 2.5x^3", "-x", "3x" or "10".
+# The sign is optional in the pattern, but only the first term may omit it.
+_TERM_RE = re.compile(r'\s*([-+]?)\s*(\d*\.?\d*)\s*(?:(x)\s*\^?\s*(\d*))?\s*')
+# evaluate() tabulates the powers of x when the degree is at most this many
+# times the number of terms, and falls back to Horner's scheme otherwise.
+_MAX_POWERS_PER_TERM = 4
+
+def _to_row_values(coefficient, exponent):
+    """
+    Convert a term to the types stored in the coeffs and exps rows.
+
+    :param coefficient: The coefficient of the term.
+    :param exponent: The exponent of the term.
+    :return: The coefficient as a C double and the exponent as a C 64-bit integer.
+    :raises TypeError: If either value can't be stored in its row.
+    :raises OverflowError: If either value is out of range for its row.
+    """
+    return array('d', [coefficient])[0], array('q', [exponent])[0]
 
 class SparsePolynomial:
     """
     A class to represent a sparse polynomial using a 2D list.
-    Each term is represented as [coefficient, exponent].
+    The terms are stored as two parallel rows, coeffs (C doubles) and
+    exps (C 64-bit integers), kept sorted by ascending exponent.
     """
 
+    __slots__ = ('coeffs', 'exps', '_str_cache')
+
     def __init__(self, polynomial_str=""):
-        # Initialize an empty 2D list to store the polynomial terms.
-        self.terms = []
+        # Initialize the empty coefficient and exponent rows of the polynomial terms.
+        self.coeffs = array('d')
+        self.exps = array('q')
+        # String representation, rebuilt lazily after a change.
+        self._str_cache = None
         if polynomial_str:
             self.parse_polynomial_string(polynomial_str)
 
     def parse_polynomial_string(self, polynomial_str):
         """
         Parse a polynomial string and add the terms to the polynomial.
+        Every term after the first must start with '+' or '-'.
 
         :param polynomial_str: The polynomial string to parse.
+        :raises ValueError: If the string is not a valid polynomial.
         """
-        # Remove spaces from the input string.
-        polynomial_str = polynomial_str.replace(" ", "")
-        # Split the input string using '+' and '-' as delimiters.
-        terms = re.split(r'(?=[-+])', polynomial_str)
-        for term in terms:
-            term = term.strip()
-            match = re.match(r'([-+]?\d*(?:\.\d+)?)x\^?(\d*)', term)
-            if match:
-                coefficient = float(match.group(1))
-                exponent = int(match.group(2)) if match.group(2) else 1
+        # Each match starts where the previous one ended, so the terms cover the whole string.
+        for match in _TERM_RE.finditer(polynomial_str):
+            sign, digits, x, exponent = match.groups()
+            if not digits and not x:
+                if sign or match.end() != len(polynomial_str):
+                    # A lone sign, or a character no term can start with (e.g. "3y").
+                    raise ValueError(f"Invalid polynomial term at position {match.start()}: {polynomial_str!r}")
+                # Empty match at the end of the string.
+                continue
+            # A term written without digits (e.g. "x^2" or "-x") has a unit coefficient.
+            coefficient = float(digits) if digits else 1.0
+            if sign == "-":
+                coefficient = -coefficient
+            elif not sign and match.start() > 0:
+                # Every term after the first must start with '+' or '-'.
+                raise ValueError(f"Invalid polynomial term at position {match.start()}: {polynomial_str!r}")
+            if x:
+                exponent = int(exponent) if exponent else 1
             else:
                 # If there's no 'x' in the term, it's a constant term (e.g., 9).
-                coefficient = float(term)
                 exponent = 0
-            self.add_term(coefficient, exponent)
+            try:
+                self.add_term_unsorted(coefficient, exponent)
+            except OverflowError:
+                # The exps row only holds 64-bit integer exponents.
+                raise ValueError(f"Exponent out of range at position {match.start()}: {polynomial_str!r}") from None
+        self._finalize()
 
     def add_term(self, coefficient, exponent):
         """
         Add a new term to the polynomial.
 
         :param coefficient: The coefficient of the term.
-        :param exponent: The exponent of the term.
+        :param exponent: The exponent of the term, a 64-bit integer.
         """
         if coefficient != 0:
+            # Convert both values first, so a rejected term leaves both rows unchanged.
+            coefficient, exponent = _to_row_values(coefficient, exponent)
+            self._str_cache = None
+            exps = self.exps
+            if not exps or exponent > exps[-1]:
+                # Terms added in ascending order of exponent just go at the end.
+                exps.append(exponent)
+                self.coeffs.append(coefficient)
+                return
             # Use binary search to find the index to insert the new term.
-            left, right = 0, len(self.terms) - 1
-            while left <= right:
-                mid = (left + right) // 2
-                if self.terms[mid][1] == exponent:
-                    self.terms[mid][0] += coefficient
-                    break
-                elif self.terms[mid][1] < exponent:
-                    left = mid + 1
-                else:
-                    right = mid - 1
+            index = bisect_left(exps, exponent)
+            if index < len(exps) and exps[index] == exponent:
+                self.coeffs[index] += coefficient
             else:
-                # If the loop completes without finding a term with the same exponent, insert the new term.
-                self.terms.insert(left, [coefficient, exponent])
+                # If there's no term with the same exponent, insert the new term.
+                exps.insert(index, exponent)
+                self.coeffs.insert(index, coefficient)
+
+    def add_term_unsorted(self, coefficient, exponent):
+        """
+        Append a new term without keeping the terms sorted.
+
+        _finalize() must be called once all the terms have been added.
+
+        :param coefficient: The coefficient of the term.
+        :param exponent: The exponent of the term, a 64-bit integer.
+        """
+        if coefficient != 0:
+            # Convert both values first, so a rejected term leaves both rows unchanged.
+            coefficient, exponent = _to_row_values(coefficient, exponent)
+            self._str_cache = None
+            self.exps.append(exponent)
+            self.coeffs.append(coefficient)
+
+    def _finalize(self):
+        """
+        Sort the terms by exponent and merge the terms with equal exponents.
+        """
+        coeffs, exps = self.coeffs, self.exps
+        merged_coeffs, merged_exps = array('d'), array('q')
+        for k in sorted(range(len(exps)), key=exps.__getitem__):
+            if merged_exps and merged_exps[-1] == exps[k]:
+                # Like add_term, a term whose coefficients cancel out is kept.
+                merged_coeffs[-1] += coeffs[k]
+            else:
+                merged_coeffs.append(coeffs[k])
+                merged_exps.append(exps[k])
+        self.coeffs, self.exps = merged_coeffs, merged_exps
 
     def evaluate(self, x):
         """
@@ -64,11 +140,51 @@ class SparsePolynomial:
         :param x: The value at which to evaluate the polynomial.
         :return: The result of the polynomial evaluation.
         """
-        result = 0
-        for coefficient, exponent in self.terms:
-            result += coefficient * (x ** exponent)
+        exps = self.exps
+        if not exps:
+            return 0.0
+        max_exp = exps[-1]
+        if exps[0] >= 0 and max_exp <= _MAX_POWERS_PER_TERM * len(exps):
+            # Tabulate x**0 .. x**max_exp with one multiplication per degree.
+            powers = [1.0] * (max_exp + 1)
+            power = 1.0
+            for i in range(1, max_exp + 1):
+                power *= x
+                powers[i] = power
+            terms = [coefficient * powers[exponent] for coefficient, exponent in zip(self.coeffs, exps)]
+            # fsum rounds the sum exactly, so terms of mixed sign and magnitude don't lose precision.
+            # The Horner walk below rounds at every step instead, so the two paths can differ
+            # in the last bits for the same polynomial.
+            try:
+                return math.fsum(terms)
+            except (OverflowError, ValueError):
+                # fsum raises when finite terms overflow or when inf and -inf meet;
+                # a plain sum gives the usual +-inf or nan.
+                return sum(terms)
+        # Horner's scheme over the sparse terms, from the highest exponent down:
+        # each step only raises x to the gap between consecutive exponents.
+        result = 0.0
+        prev_exp = None
+        for coefficient, exponent in zip(reversed(self.coeffs), reversed(exps)):
+            if prev_exp is None:
+                result = coefficient
+            else:
+                result = result * pow(x, prev_exp - exponent) + coefficient
+            prev_exp = exponent
+        if prev_exp:
+            # Account for the lowest exponent when there is no constant term.
+            result *= pow(x, prev_exp)
         return result
 
+    def evaluate_batch(self, xs):
+        """
+        Evaluate the polynomial for each value in xs.
+
+        :param xs: An iterable of values at which to evaluate the polynomial.
+        :return: A list with the result of the evaluation for each value.
+        """
+        return [self.evaluate(x) for x in xs]
+
     def __add__(self, other):
         """
         Add two sparse polynomials and return a new sparse polynomial.
@@ -79,27 +195,46 @@ class SparsePolynomial:
         if not isinstance(other, SparsePolynomial):
             raise TypeError("The 'other' object must be an instance of SparsePolynomial.")
 
+        n1, n2 = len(self.exps), len(other.exps)
         result = SparsePolynomial()
-        i = 0  # Index for self.terms
-        j = 0  # Index for other.terms
+        # Preallocate room for every term; the unused space is trimmed by the tail copy.
+        coeffs = result.coeffs = array('d', [0.0] * (n1 + n2))
+        exps = result.exps = array('q', [0] * (n1 + n2))
+        i = 0  # Index for self's terms
+        j = 0  # Index for other's terms
+        k = 0  # Index for the result's terms
 
-        while i < len(self.terms) and j < len(other.terms):
-            coeff1, exp1 = self.terms[i]
-            coeff2, exp2 = other.terms[j]
+        # Both operands are sorted by exponent, so the sum is a single linear merge.
+        while i < n1 and j < n2:
+            exp1 = self.exps[i]
+            exp2 = other.exps[j]
 
             if exp1 == exp2:
-                result.add_term(coeff1 + coeff2, exp1)
+                coefficient = self.coeffs[i] + other.coeffs[j]
+                if coefficient != 0:
+                    coeffs[k] = coefficient
+                    exps[k] = exp1
+                    k += 1
                 i += 1
                 j += 1
             elif exp1 < exp2:
-                result.add_term(coeff1, exp1)
+                coeffs[k] = self.coeffs[i]
+                exps[k] = exp1
+                k += 1
                 i += 1
             else:
-                result.add_term(coeff2, exp2)
+                coeffs[k] = other.coeffs[j]
+                exps[k] = exp2
+                k += 1
                 j += 1
 
-        # Append any remaining terms from self.terms and other.terms
-        result += self.terms[i:] + other.terms[j:]
+        # At most one operand has terms left; copy them over the unused space.
+        if i < n1:
+            coeffs[k:] = self.coeffs[i:]
+            exps[k:] = self.exps[i:]
+        else:
+            coeffs[k:] = other.coeffs[j:]
+            exps[k:] = other.exps[j:]
 
         return result
 
@@ -110,17 +245,12 @@ class SparsePolynomial:
         :param n: The exponent of the term to return.
         :return: A float coefficient for the term with exponent n.
         """
-        # Use binary search to find the index to insert the new term.
-        left, right = 0, len(self.terms) - 1
-        while left <= right:
-            mid = (left + right) // 2
-            if self.terms[mid][1] == n:
-                return self.terms[mid][0]
-            elif self.terms[mid][1] < n:
-                left = mid + 1
-            else:
-                right = mid - 1
-        # If the loop completes without finding a term with the same exponent, return 0.
+        # Use binary search to find the term with exponent n.
+        exps = self.exps
+        index = bisect_left(exps, n)
+        if index < len(exps) and exps[index] == n:
+            return self.coeffs[index]
+        # If there's no term with the same exponent, return 0.
         return 0
 
     def __str__(self):
@@ -129,12 +259,21 @@ class SparsePolynomial:
 
         :return: A string representing the polynomial.
         """
-        terms_str = [f"{coeff}x^{exp}" if exp > 0 else str(coeff) for coeff, exp in self.terms]
-        terms_str.reverse()
-        return " + ".join(terms_str)
+        if self._str_cache is None:
+            terms_str = [f"{coeff}x^{exp}" if exp > 0 else str(coeff) for coeff, exp in zip(self.coeffs, self.exps)]
+            terms_str.reverse()
+            self._str_cache = " + ".join(terms_str)
+        return self._str_cache
 
-# Example test:
-polynomial_str1 = "2.1x^8 + 30x^9 + 3x + 10 + 10x^9 + 1 - 10"
-sp1 = SparsePolynomial(polynomial_str1)
-print(sp1)
-print(sp1.find_coefficient(9))
\ No newline at end of file
+if __name__ == "__main__":
+    # Example test:
+    polynomial_str1 = "2.1x^8 + 30x^9 + 3x + 10 + 10x^9 + 1 - 10"
+    sp1 = SparsePolynomial(polynomial_str1)
+    print(sp1)
+    print(sp1.find_coefficient(9))
+    # Malformed input is rejected:
+    for invalid_str in ("1.2.3", "3 4", "2x^3x^4"):
+        try:
+            SparsePolynomial(invalid_str)
+        except ValueError as error:
+            print(error)
@@ -1,4 +1,13 @@
+import math
 import re
+from operator import itemgetter
+
+# Matches one term as (sign, digits, 'x', exponent), e.g. "+ 2.5x^3", "-x", "3x" or "10".
+# The sign is optional in the pattern, but only the first term may omit it.
+_TERM_RE = re.compile(r'\s*([-+]?)\s*(\d*\.?\d*)\s*(?:(x)\s*\^?\s*(\d*))?\s*')
+# evaluate() tabulates the powers of x when the degree is at most this many
+# times the number of terms, and falls back to Horner's scheme otherwise.
+_MAX_POWERS_PER_TERM = 4
 
 class SparsePolynomial:
     """
@@ -6,32 +15,47 @@ class SparsePolynomial:
     Keys represent exponents, and values represent coefficients.
     """
 
+    __slots__ = ('terms', '_sorted_terms', '_str_cache')
+
     def __init__(self, polynomial_str=""):
         # Initialize an empty dictionary to store the polynomial terms.
         self.terms = {}
+        # Tuple of (exponent, coefficient) pairs sorted by descending exponent,
+        # rebuilt lazily after a change and shared by repeated evaluations.
+        self._sorted_terms = None
+        # String representation, rebuilt lazily after a change.
+        self._str_cache = None
         if polynomial_str:
             self.parse_polynomial_string(polynomial_str)
 
     def parse_polynomial_string(self, polynomial_str):
         """
         Parse a polynomial string and add the terms to the polynomial.
+        Every term after the first must start with '+' or '-'.
 
         :param polynomial_str: The polynomial string to parse.
+        :raises ValueError: If the string is not a valid polynomial.
         """
-        # Remove spaces from the input string.
-        polynomial_str = polynomial_str.replace(" ", "")
-        # Split the input string using '+' and '-' as delimiters.
-        terms = re.split(r'(?=[-+])', polynomial_str)
-        print(terms)
-        for term in terms:
-            term = term.strip()
-            match = re.match(r'([-+]?\d*(?:\.\d+)?)x\^?(\d*)', term)
-            if match:
-                coefficient = float(match.group(1))
-                exponent = int(match.group(2)) if match.group(2) else 1
+        # Each match starts where the previous one ended, so the terms cover the whole string.
+        for match in _TERM_RE.finditer(polynomial_str):
+            sign, digits, x, exponent = match.groups()
+            if not digits and not x:
+                if sign or match.end() != len(polynomial_str):
+                    # A lone sign, or a character no term can start with (e.g. "3y").
+                    raise ValueError(f"Invalid polynomial term at position {match.start()}: {polynomial_str!r}")
+                # Empty match at the end of the string.
+                continue
+            # A term written without digits (e.g. "x^2" or "-x") has a unit coefficient.
+            coefficient = float(digits) if digits else 1.0
+            if sign == "-":
+                coefficient = -coefficient
+            elif not sign and match.start() > 0:
+                # Every term after the first must start with '+' or '-'.
+                raise ValueError(f"Invalid polynomial term at position {match.start()}: {polynomial_str!r}")
+            if x:
+                exponent = int(exponent) if exponent else 1
             else:
                 # If there's no 'x' in the term, it's a constant term (e.g., 9).
-                coefficient = float(term)
                 exponent = 0
             self.add_term(coefficient, exponent)
 
@@ -43,6 +67,8 @@ class SparsePolynomial:
         :param exponent: The exponent of the term.
         """
         if coefficient != 0:
+            self._sorted_terms = None
+            self._str_cache = None
             if exponent in self.terms:
                 self.terms[exponent] += coefficient
             else:
@@ -55,11 +81,55 @@ class SparsePolynomial:
         :param x: The value at which to evaluate the polynomial.
         :return: The result of the polynomial evaluation.
         """
-        result = 0
-        for exponent, coefficient in self.terms.items():
-            result += coefficient * (x ** exponent)
+        if self._sorted_terms is None:
+            self._sorted_terms = tuple(sorted(self.terms.items(), key=itemgetter(0), reverse=True))
+        sorted_terms = self._sorted_terms
+        if not sorted_terms:
+            return 0.0
+        max_exp = sorted_terms[0][0]
+        if (sorted_terms[-1][0] >= 0 and max_exp <= _MAX_POWERS_PER_TERM * len(sorted_terms)
+                # The table is indexed by exponent, so every exponent must be an int.
+                and all(isinstance(exponent, int) for exponent, _ in sorted_terms)):
+            # Tabulate x**0 .. x**max_exp with one multiplication per degree.
+            powers = [1.0] * (max_exp + 1)
+            power = 1.0
+            for i in range(1, max_exp + 1):
+                power *= x
+                powers[i] = power
+            terms = [coefficient * powers[exponent] for exponent, coefficient in sorted_terms]
+            # fsum rounds the sum exactly, so terms of mixed sign and magnitude don't lose precision.
+            # The Horner walk below rounds at every step instead, so the two paths can differ
+            # in the last bits for the same polynomial.
+            try:
+                return math.fsum(terms)
+            except (OverflowError, ValueError):
+                # fsum raises when finite terms overflow or when inf and -inf meet;
+                # a plain sum gives the usual +-inf or nan.
+                return sum(terms)
+        # Horner's scheme over the sparse terms, from the highest exponent down:
+        # each step only raises x to the gap between consecutive exponents.
+        result = 0.0
+        prev_exp = None
+        for exponent, coefficient in sorted_terms:
+            if prev_exp is None:
+                result = coefficient
+            else:
+                result = result * pow(x, prev_exp - exponent) + coefficient
+            prev_exp = exponent
+        if prev_exp:
+            # Account for the lowest exponent when there is no constant term.
+            result *= pow(x, prev_exp)
         return result
 
+    def evaluate_batch(self, xs):
+        """
+        Evaluate the polynomial for each value in xs.
+
+        :param xs: An iterable of values at which to evaluate the polynomial.
+        :return: A list with the result of the evaluation for each value.
+        """
+        return [self.evaluate(x) for x in xs]
+
     def __add__(self, other):
         """
         Add two sparse polynomials and return a new sparse polynomial.
@@ -70,10 +140,14 @@ class SparsePolynomial:
         if not isinstance(other, SparsePolynomial):
             raise TypeError("The 'other' object must be an instance of SparsePolynomial.")
         result = SparsePolynomial()
-        for exponent, coefficient in self.terms.items():
-            result.add_term(coefficient, exponent)
+        terms = result.terms = dict(self.terms)
         for exponent, coefficient in other.terms.items():
-            result.add_term(coefficient, exponent)
+            coefficient += terms.get(exponent, 0.0)
+            if coefficient != 0:
+                terms[exponent] = coefficient
+            else:
+                # The coefficients cancel out, so drop the term.
+                terms.pop(exponent, None)
         return result
 
     def find_coefficient(self, n):
@@ -81,9 +155,9 @@ class SparsePolynomial:
         Return the coefficient of the term with exponent n.
 
         :param n: The exponent of the term to return.
-        :return: A float coefficient the term with exponent n.
+        :return: A float coefficient for the term with exponent n, or 0.0 if there's no such term.
         """
-        return self.terms[n]
+        return self.terms.get(n, 0.0)
 
     def __str__(self):
         """
@@ -91,11 +165,21 @@ class SparsePolynomial:
 
         :return: A string representing the polynomial.
         """
-        terms_str = [f"{coeff}x^{exp}" if exp > 0 else str(coeff) for exp, coeff in self.terms.items()]
-        return " + ".join(terms_str)
-
-# Example test:
-polynomial_str1 = "2.1x^8 + 30x^9 + 3x + 10 + 10x^9 + 1 - 10"
-sp1 = SparsePolynomial(polynomial_str1)
-print(sp1)
-print(sp1.find_coefficient(9))
+        if self._str_cache is None:
+            terms_str = [f"{coeff}x^{exp}" if exp > 0 else str(coeff) for exp, coeff in self.terms.items()]
+            self._str_cache = " + ".join(terms_str)
+        return self._str_cache
+
+if __name__ == "__main__":
+    # Example test:
+    polynomial_str1 = "2.1x^8 + 30x^9 + 3x + 10 + 10x^9 + 1 - 10"
+    sp1 = SparsePolynomial(polynomial_str1)
+    print(sp1)
+    print(sp1.find_coefficient(9))
+    # Malformed input is rejected:
+    for invalid_str in ("1.2.3", "3 4", "2x^3x^4"):
+        try:
+            SparsePolynomial(invalid_str)
+        except ValueError as error:
+            print(error)
+